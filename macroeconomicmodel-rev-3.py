@@ -6,6 +6,239 @@ from tqdm import tqdm
 import random
 import os
 import csv
+import logging
+from enum import IntEnum
+from operator import attrgetter
+from multiprocessing import Pool, freeze_support
+try:
+    from numba import njit
+except ImportError:
+    # Numba is optional: the kernels below are plain NumPy expressions and also run without it
+    def njit(*args, **kwargs):
+        if args and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+logger = logging.getLogger(__name__)
+
+EXPERTISE_LEVELS = ["low", "medium", "high", "expert"]
+
+# Indexed by expertise id (position in EXPERTISE_LEVELS): the Business.collar_counts bucket
+# an employee is counted in (0 blue collar, 1 white collar, 2 expert) and the hiring salary range
+EXPERTISE_COLLAR = (0, 0, 1, 2)
+EXPERTISE_SALARY_RANGE = ((40, 60), (40, 60), (60, 80), (80, 100))
+# The same ranges as arrays (both ends inclusive) for drawing salaries in bulk
+EXPERTISE_SALARY_LOW, EXPERTISE_SALARY_HIGH = np.array(EXPERTISE_SALARY_RANGE).T
+
+class BusinessType(IntEnum):
+    # Stored as integers in Country.business_type_arr; the manufacturing types come first
+    MANUFACTURING_LOCAL_CONSUMERS = 0
+    MANUFACTURING_LOCAL_BUSINESSES = 1
+    MANUFACTURING_EXPORT = 2
+    IMPORT_CITIZENS_CONSUMERS = 3
+    IMPORT_BUSINESS_CUSTOMERS = 4
+    AI = 5
+
+    @property
+    def is_manufacturing(self):
+        return self <= BusinessType.MANUFACTURING_EXPORT
+
+    @property
+    def is_import(self):
+        return self in (BusinessType.IMPORT_CITIZENS_CONSUMERS, BusinessType.IMPORT_BUSINESS_CUSTOMERS)
+
+# Per-type flags indexed by a business_type_arr, for whole-country masks
+IS_MANUFACTURING = np.array([business_type.is_manufacturing for business_type in BusinessType])
+IS_IMPORT = np.array([business_type.is_import for business_type in BusinessType])
+
+# Country attributes recorded by EconomicModel.step
+HISTORY_KEYS = [
+    'inflation',
+    'economic_growth',
+    'tax_revenue',
+    'import_duty_revenue',
+    'total_revenue',
+    'citizen_happiness',
+    'local_manufacturing_boost',
+    'money_supply',
+    'interest_rate',
+    'central_bank_policy',
+    'government_spending'
+]
+# Reads all HISTORY_KEYS attributes of a country in one call
+HISTORY_GETTER = attrgetter(*HISTORY_KEYS)
+
+# (history key, title, y-axis label) for each panel of EconomicModel.plot_results
+PLOT_PANELS = [
+    ('inflation', 'Inflation', 'Inflation Rate'),
+    ('economic_growth', 'Economic Growth', 'Growth Rate'),
+    ('money_supply', 'Money Supply', 'Money Supply'),
+    ('interest_rate', 'Interest Rate', 'Rate'),
+    ('central_bank_policy', 'Central Bank Policy', 'Policy (-: Contractionary, +: Expansionary)'),
+    ('total_revenue', 'Total Government Revenue', 'Revenue'),
+    ('tax_revenue', 'Tax Revenue', 'Revenue'),
+    ('import_duty_revenue', 'Import Duty Revenue', 'Revenue'),
+    ('citizen_happiness', 'Citizen Happiness', 'Happiness')
+]
+
+# (result column, history key) pairs averaged by the duty rate and interest rate sweeps
+DUTY_RATE_COLUMNS = [
+    ('avg_happiness', 'citizen_happiness'),
+    ('avg_growth', 'economic_growth'),
+    ('avg_revenue', 'total_revenue'),
+    ('avg_inflation', 'inflation'),
+    ('avg_money_supply', 'money_supply'),
+    ('avg_interest_rate', 'interest_rate')
+]
+INTEREST_RATE_COLUMNS = [
+    ('avg_happiness', 'citizen_happiness'),
+    ('avg_growth', 'economic_growth'),
+    ('avg_inflation', 'inflation'),
+    ('avg_money_supply', 'money_supply')
+]
+# The same for the averages reported by run_policy_combinations
+POLICY_RESULT_COLUMNS = [
+    ('avg_happiness', 'citizen_happiness'),
+    ('avg_growth', 'economic_growth'),
+    ('avg_revenue', 'total_revenue'),
+    ('avg_spending', 'government_spending'),
+    ('avg_inflation', 'inflation'),
+    ('avg_money_supply', 'money_supply')
+]
+
+# Country.collect_statistics output, formatted and printed in one call
+COUNTRY_STATISTICS_TEMPLATE = """Country statistics:
+  Tax rate: {self.tax_rate:.2f}
+  Import duty rate: {self.import_duty_rate:.2f}
+  Interest rate: {self.interest_rate:.2f}
+  Inflation: {self.inflation:.2f}
+  Economic growth: {self.economic_growth:.2f}
+  Tax revenue: {self.tax_revenue:.2f}
+  Import duty revenue: {self.import_duty_revenue:.2f}
+  Total government revenue: {self.total_revenue:.2f}
+  Local manufacturing boost: {self.local_manufacturing_boost:.2f}
+  Money supply: {self.money_supply:.2f}
+  Money velocity: {self.money_velocity:.2f}
+  Government spending: {self.government_spending:.2f}
+  Central bank policy: {self.central_bank_policy:.2f}
+  Citizen happiness: {self.citizen_happiness:.2f}
+  Number of citizens: {num_citizens}
+  Number of businesses: {num_businesses}"""
+
+def development_level_category(development_level):
+    # Shared by ConfigManager and Country so the thresholds live in one place
+    if development_level > 0.7:
+        return "high"
+    elif development_level > 0.4:
+        return "medium"
+    else:
+        return "low"
+
+class CountryArrayField:
+    # Agent attribute stored at agent.idx in one of the per-agent arrays of agent.country
+    def __init__(self, array_name):
+        self.array_name = array_name
+    def __get__(self, agent, owner=None):
+        if agent is None:
+            return self
+        return getattr(agent.country, self.array_name)[agent.idx]
+    def __set__(self, agent, value):
+        getattr(agent.country, self.array_name)[agent.idx] = value
+
+@njit(cache=True, fastmath=True)
+def step_happiness(salary, employed, savings, happiness, values_social_services, values_economic_freedom,
+                   trust_in_government, import_goods_preference, import_price_sensitivity,
+                   inflation_sensitivity, noise, tax_rate, social_services_spending, import_duty_rate,
+                   local_manufacturing_boost, inflation, interest_rate):
+    # Citizen.update_happiness for every citizen of a country at once; happiness and savings are updated in place.
+    # Returns the total happiness (float64) so the country mean needs no separate pass
+    # Country-wide factors are combined once here so each citizen term is a single multiply
+    net_salary_share = 1 - tax_rate
+    social_services_level = social_services_spending * 100
+    economic_freedom_level = net_salary_share * 100
+    import_price_level = -(import_duty_rate * 100)
+    inflation_level = -(inflation * 200)
+    interest_level = interest_rate * 0.2
+    employed_savings_factor = 1 + interest_rate - inflation
+    unemployed_savings_factor = 1 - inflation - 0.05
+    economic_factor = np.where(employed, np.minimum(100.0, salary * net_salary_share),
+                               min(50.0, social_services_level))
+    social_services_satisfaction = values_social_services * social_services_level
+    economic_freedom_satisfaction = values_economic_freedom * economic_freedom_level
+    trust_factor = trust_in_government * 20
+    import_price_impact = import_goods_preference * import_price_sensitivity * import_price_level
+    employment_opportunity_impact = np.where(employed, local_manufacturing_boost * 5,
+                                             local_manufacturing_boost * 20)
+    inflation_impact = inflation_sensitivity * inflation_level
+    interest_impact = savings * interest_level
+    new_happiness = (
+        0.30 * economic_factor +
+        0.15 * social_services_satisfaction +
+        0.15 * economic_freedom_satisfaction +
+        0.08 * trust_factor +
+        0.08 * import_price_impact +
+        0.08 * employment_opportunity_impact +
+        0.08 * inflation_impact +
+        0.05 * interest_impact +
+        0.03 * noise  # Random factor
+    )
+    happiness[:] = np.minimum(100.0, np.maximum(0.0, 0.7 * happiness + 0.3 * new_happiness))
+    savings[:] = np.where(
+        employed,
+        # Save 10% of salary, earn interest, lose to inflation
+        np.maximum(0.0, savings * employed_savings_factor + salary * 0.1),
+        # Unemployed citizens spend savings
+        np.maximum(0.0, savings * unemployed_savings_factor)
+    )
+    return happiness.sum(dtype=np.float64)
+
+@njit(cache=True, fastmath=True)
+def step_businesses(type_id, size_factor, automation_level, interest_rate_sensitivity, employee_count, payroll,
+                    max_employees, revenue, costs, profit, tax_payable, import_duty_payable, borrowing,
+                    economic_growth, local_manufacturing_boost, external_influences, import_duty_rate,
+                    development_level, money_supply, interest_rate, inflation, tax_rate):
+    # Business.update_business for every business of a country at once; results are written in place.
+    # Returns the total tax and import duty payable (float64) for the country's revenue
+    is_import = IS_IMPORT[type_id]
+    # Country-wide factors are combined once here so each business term is a single multiply
+    interest_rate_gap = 0.05 - interest_rate
+    manufacturing_term = economic_growth * 2 + local_manufacturing_boost
+    import_term = economic_growth - import_duty_rate * 2 - external_influences / 300
+    # Revenue term of each business type for this step, in BusinessType order, gathered by type_id
+    type_revenue_term = np.array([
+        manufacturing_term,
+        manufacturing_term,
+        manufacturing_term + external_influences / 200,  # External influences affect exports
+        import_term,
+        import_term,
+        economic_growth * 3 + development_level * 0.5
+    ])
+    base_revenue_factor = (
+        (1.0 + (money_supply / 1000) * 0.2) +
+        type_revenue_term[type_id] +
+        interest_rate_gap * interest_rate_sensitivity
+    )
+    employee_factor = employee_count / np.maximum(1, max_employees)
+    revenue[:] = 100 * size_factor * base_revenue_factor * (0.5 + 0.5 * employee_factor)
+    operating_costs = 20 * size_factor * (1 - 0.5 * automation_level)
+    interest_costs = borrowing * interest_rate
+    import_duty_payable[:] = is_import * revenue * import_duty_rate
+    inflation_cost_increase = operating_costs * (inflation * 2)
+    costs[:] = payroll + operating_costs + import_duty_payable + interest_costs + inflation_cost_increase
+    profit[:] = revenue - costs
+    tax_payable[:] = np.maximum(0.0, profit) * tax_rate
+    if interest_rate < 0.04:
+        borrowing[:] = np.where(profit > 0, borrowing + revenue * (0.1 * (1 - interest_rate * 10)),
+                                np.maximum(0.0, borrowing * 0.95))
+    else:
+        borrowing[:] = np.maximum(0.0, borrowing * 0.95)
+    size_change_factor = np.where((profit > 50 * size_factor) & (employee_count >= max_employees * 0.9), 0.1,
+                                  np.where(profit < -20 * size_factor, -0.1, 0.0))
+    size_change_factor += interest_rate_sensitivity * (interest_rate_gap * 0.5)
+    resized = (max_employees * (1 + size_change_factor)).astype(np.int64)
+    max_employees[:] = np.where(size_change_factor > 0, np.minimum(100, resized),
+                                np.where(size_change_factor < 0, np.maximum(1, resized), max_employees))
+    return tax_payable.sum(dtype=np.float64), import_duty_payable.sum(dtype=np.float64)
 
 class ConfigManager:
     def __init__(self, config_dir="config"):
@@ -15,10 +248,18 @@ class ConfigManager:
         self.country_params_file = os.path.join(config_dir, "country_parameters.csv")
         self.citizen_params_file = os.path.join(config_dir, "citizen_parameters.csv")
         self.business_params_file = os.path.join(config_dir, "business_parameters.csv")    
+        # Parsed parameter files by path; every model built from this manager reuses them
+        self._parameters = {}
     def generate_template_files(self):
+        self._parameters.clear()
         self._generate_country_params_template()
         self._generate_citizen_params_template()
         self._generate_business_params_template()
+    def _write_template(self, path, rows):
+        with open(path, "w", newline="") as f:
+            writer = csv.DictWriter(f, fieldnames=rows[0].keys(), lineterminator="\n")
+            writer.writeheader()
+            writer.writerows(rows)
     def _generate_country_params_template(self):
         countries = [
             {
@@ -56,8 +297,7 @@ class ConfigManager:
                 "external_influences": -30
             }
         ]
-        df = pd.DataFrame(countries)
-        df.to_csv(self.country_params_file, index=False)    
+        self._write_template(self.country_params_file, countries)
     def _generate_citizen_params_template(self):
         params = [
             {
@@ -109,8 +349,7 @@ class ConfigManager:
                 "initial_employment_rate": 0.6
             }
         ]
-        df = pd.DataFrame(params)
-        df.to_csv(self.citizen_params_file, index=False)    
+        self._write_template(self.citizen_params_file, params)
     def _generate_business_params_template(self):
         params = [
             {
@@ -148,48 +387,51 @@ class ConfigManager:
                 "max_interest_rate_sensitivity": 1.5
             }
         ]
-        df = pd.DataFrame(params)
-        df.to_csv(self.business_params_file, index=False)    
+        self._write_template(self.business_params_file, params)
     def load_country_parameters(self):
+        if self.country_params_file in self._parameters:
+            return self._parameters[self.country_params_file]
         if not os.path.exists(self.country_params_file):
             print(f"Country parameters file not found: {self.country_params_file}")
             print("Generating template files...")
             self.generate_template_files()        
         try:
             df = pd.read_csv(self.country_params_file)
-            return df.to_dict('records')
+            self._parameters[self.country_params_file] = df.to_dict('records')
+            return self._parameters[self.country_params_file]
         except Exception as e:
             print(f"Error loading country parameters: {e}")
             return None    
     def load_citizen_parameters(self):
+        if self.citizen_params_file in self._parameters:
+            return self._parameters[self.citizen_params_file]
         if not os.path.exists(self.citizen_params_file):
             print(f"Citizen parameters file not found: {self.citizen_params_file}")
             print("Generating template files...")
             self.generate_template_files()        
         try:
             df = pd.read_csv(self.citizen_params_file)
-            return {row["development_level"]: row.to_dict() for _, row in df.iterrows()}
+            self._parameters[self.citizen_params_file] = {record["development_level"]: record for record in df.to_dict('records')}
+            return self._parameters[self.citizen_params_file]
         except Exception as e:
             print(f"Error loading citizen parameters: {e}")
             return None
     def load_business_parameters(self):
+        if self.business_params_file in self._parameters:
+            return self._parameters[self.business_params_file]
         if not os.path.exists(self.business_params_file):
             print(f"Business parameters file not found: {self.business_params_file}")
             print("Generating template files...")
             self.generate_template_files()        
         try:
             df = pd.read_csv(self.business_params_file)
-            return {row["development_level"]: row.to_dict() for _, row in df.iterrows()}
+            self._parameters[self.business_params_file] = {record["development_level"]: record for record in df.to_dict('records')}
+            return self._parameters[self.business_params_file]
         except Exception as e:
             print(f"Error loading business parameters: {e}")
             return None
     def get_development_level_category(self, development_level):
-        if development_level > 0.7:
-            return "high"
-        elif development_level > 0.4:
-            return "medium"
-        else:
-            return "low"
+        return development_level_category(development_level)
 
 class Country(mesa.Agent):
     def __init__(self, model, country_config=None):
@@ -218,9 +460,11 @@ class Country(mesa.Agent):
             self.immigration_incentives = self.random.uniform(0, 0.1)
             self.import_duty_rate = self.random.uniform(0.05, 0.25)
             self.external_influences = self.random.randint(-100, 100)
+        # The development level is fixed for the run, so its parameter category is looked up once
+        self.development_level_category = self.get_development_level_category()
         self.bonds_issued = 0
         self.import_duty_revenue = 0
-        self.local_manufacturing_boost = 0
+        self.local_manufacturing_boost = 0.0
         self.inflation = self.random.uniform(0.01, 0.05)
         self.economic_growth = self.random.uniform(0.01, 0.03)
         self.tax_revenue = 0
@@ -235,407 +479,423 @@ class Country(mesa.Agent):
         self.central_bank_policy = self.random.uniform(-0.1, 0.1)
         self.citizens = []
         self.businesses = []
+        # Businesses with vacancies, refreshed once per step and shrunk as positions are filled
+        self.open_businesses = []
+        self.open_manufacturing = []
+        # Sum of employed citizens' salaries, kept up to date on hire and layoff
+        self.employed_salary_sum = 0.0
+        # Per-step totals returned by the business and happiness kernels
+        self.business_tax_total = 0.0
+        self.business_import_duty_total = 0.0
+        self.happiness_total = 0.0
+        self.allocate_agent_arrays(0, 0)
         self.agent_type = "Country"
+    def allocate_agent_arrays(self, num_citizens, num_businesses):
+        # Citizen and business state lives in these arrays (see CountryArrayField) so that
+        # the per-step updates run as whole-country kernels. Agent attributes are float32:
+        # they are bounded scores and small amounts, and halving the bytes per agent keeps
+        # the sweeps in cache for large populations. Running totals (payroll) stay float64,
+        # and sums over agents are accumulated in float64. Codes are uint8 and employer
+        # indices int32 (-1 for none)
+        self.salary_arr = np.zeros(num_citizens, dtype=np.float32)
+        self.employed_arr = np.zeros(num_citizens, dtype=bool)
+        self.happiness_arr = np.zeros(num_citizens, dtype=np.float32)
+        self.savings_arr = np.zeros(num_citizens, dtype=np.float32)
+        self.values_social_services_arr = np.zeros(num_citizens, dtype=np.float32)
+        self.values_economic_freedom_arr = np.zeros(num_citizens, dtype=np.float32)
+        self.trust_in_government_arr = np.zeros(num_citizens, dtype=np.float32)
+        self.import_goods_preference_arr = np.zeros(num_citizens, dtype=np.float32)
+        self.import_price_sensitivity_arr = np.zeros(num_citizens, dtype=np.float32)
+        self.inflation_sensitivity_arr = np.zeros(num_citizens, dtype=np.float32)
+        self.employer_arr = np.full(num_citizens, -1, dtype=np.int32)
+        self.expertise_arr = np.zeros(num_citizens, dtype=np.uint8)
+        self.business_type_arr = np.zeros(num_businesses, dtype=np.uint8)
+        self.business_size_factor_arr = np.zeros(num_businesses, dtype=np.float32)
+        self.business_automation_level_arr = np.zeros(num_businesses, dtype=np.float32)
+        self.business_investment_rate_arr = np.zeros(num_businesses, dtype=np.float32)
+        self.business_interest_rate_sensitivity_arr = np.zeros(num_businesses, dtype=np.float32)
+        self.business_max_employees_arr = np.zeros(num_businesses, dtype=np.int64)
+        self.business_employee_count_arr = np.zeros(num_businesses, dtype=np.int64)
+        self.business_payroll_arr = np.zeros(num_businesses)
+        self.business_revenue_arr = np.zeros(num_businesses, dtype=np.float32)
+        self.business_costs_arr = np.zeros(num_businesses, dtype=np.float32)
+        self.business_profit_arr = np.zeros(num_businesses, dtype=np.float32)
+        self.business_tax_arr = np.zeros(num_businesses, dtype=np.float32)
+        self.business_import_duty_arr = np.zeros(num_businesses, dtype=np.float32)
+        self.business_borrowing_arr = np.zeros(num_businesses, dtype=np.float32)
+    def grow_agent_arrays(self, num_citizens, num_businesses):
+        # Append zero-initialised room for more agents to every per-agent array, keeping existing entries
+        current = {name: value for name, value in vars(self).items() if name.endswith("_arr")}
+        self.allocate_agent_arrays(num_citizens, num_businesses)
+        for name, existing in current.items():
+            setattr(self, name, np.concatenate([existing, getattr(self, name)]))
+    def get_development_level_category(self):
+        return development_level_category(self.development_level)
+    def add_citizens(self, count, citizen_params=None):
+        # One vectorised draw per attribute for all new citizens
+        params = None
+        if citizen_params:
+            params = citizen_params.get(self.development_level_category)
+        rng = self.rng
+        new = slice(len(self.citizens), len(self.citizens) + count)
+        self.grow_agent_arrays(count, 0)
+        if params:
+            self.salary_arr[new] = rng.integers(int(params["min_salary"]), int(params["max_salary"]),
+                                                count, endpoint=True)
+            expertise_distribution = np.array([
+                params["expertise_low_pct"],
+                params["expertise_medium_pct"],
+                params["expertise_high_pct"],
+                params["expertise_expert_pct"]
+            ])
+            expertise_ids = rng.choice(len(EXPERTISE_LEVELS), count,
+                                       p=expertise_distribution / expertise_distribution.sum())
+            self.values_social_services_arr[new] = rng.uniform(
+                params["min_values_social_services"], params["max_values_social_services"], count)
+            self.values_economic_freedom_arr[new] = rng.uniform(
+                params["min_values_economic_freedom"], params["max_values_economic_freedom"], count)
+            self.trust_in_government_arr[new] = rng.uniform(
+                params["min_trust_in_government"], params["max_trust_in_government"], count)
+            self.import_goods_preference_arr[new] = rng.uniform(
+                params["min_import_goods_preference"], params["max_import_goods_preference"], count)
+            self.import_price_sensitivity_arr[new] = rng.uniform(
+                params["min_import_price_sensitivity"], params["max_import_price_sensitivity"], count)
+            self.inflation_sensitivity_arr[new] = rng.uniform(
+                params["min_inflation_sensitivity"], params["max_inflation_sensitivity"], count)
+            self.savings_arr[new] = rng.uniform(params["min_savings"], params["max_savings"], count)
+            self.employed_arr[new] = rng.random(count) < params["initial_employment_rate"]
+        else:
+            # Use default values as in original code
+            self.salary_arr[new] = rng.integers(40, 60, count, endpoint=True)
+            expertise_ids = rng.integers(len(EXPERTISE_LEVELS), size=count)
+            self.values_social_services_arr[new] = rng.uniform(0, 1, count)
+            self.values_economic_freedom_arr[new] = rng.uniform(0, 1, count)
+            self.trust_in_government_arr[new] = rng.uniform(0, 1, count)
+            self.import_goods_preference_arr[new] = rng.uniform(0.2, 0.8, count)
+            self.import_price_sensitivity_arr[new] = rng.uniform(0.3, 1.0, count)
+            self.inflation_sensitivity_arr[new] = rng.uniform(0.3, 1.0, count)
+            self.savings_arr[new] = rng.uniform(10, 100, count)
+            self.employed_arr[new] = rng.random(count) < 0.8
+        self.happiness_arr[new] = rng.integers(40, 60, count, endpoint=True)
+        self.expertise_arr[new] = expertise_ids
+        self.employed_salary_sum += float(self.salary_arr[new][self.employed_arr[new]].sum(dtype=np.float64))
+        for _ in range(count):
+            Citizen(self.model, self)
+    def add_businesses(self, count, business_params=None):
+        params = None
+        if business_params:
+            params = business_params.get(self.development_level_category)
+        rng = self.rng
+        new = slice(len(self.businesses), len(self.businesses) + count)
+        self.grow_agent_arrays(0, count)
+        if params:
+            business_weights = np.array([
+                params["manufacturing_local_consumers_pct"],
+                params["manufacturing_local_businesses_pct"],
+                params["manufacturing_export_pct"],
+                params["import_citizens_consumers_pct"],
+                params["import_business_customers_pct"],
+                params["ai_pct"]
+            ])
+            self.business_type_arr[new] = rng.choice(len(BusinessType), count,
+                                                      p=business_weights / business_weights.sum())
+            self.business_automation_level_arr[new] = rng.uniform(
+                params["min_automation_level"], params["max_automation_level"], count)
+            self.business_size_factor_arr[new] = rng.uniform(
+                params["min_size_factor"], params["max_size_factor"], count)
+            self.business_investment_rate_arr[new] = rng.uniform(
+                params["min_investment_rate"], params["max_investment_rate"], count)
+            self.business_interest_rate_sensitivity_arr[new] = rng.uniform(
+                params["min_interest_rate_sensitivity"], params["max_interest_rate_sensitivity"], count)
+        else:
+            self.business_type_arr[new] = rng.integers(len(BusinessType), size=count)
+            self.business_automation_level_arr[new] = rng.uniform(0.1, 0.9, count)
+            self.business_size_factor_arr[new] = rng.uniform(0.5, 2.0, count)
+            self.business_investment_rate_arr[new] = rng.uniform(0.1, 0.4, count)
+            self.business_interest_rate_sensitivity_arr[new] = rng.uniform(0.5, 1.5, count)
+        # AI businesses need fewer employees
+        is_ai = self.business_type_arr[new] == BusinessType.AI
+        self.business_max_employees_arr[new] = np.where(is_ai, 2, 10) * self.business_size_factor_arr[new]
+        for _ in range(count):
+            Business(self.model, self)
+        self.refresh_open_businesses()
+    def refresh_open_businesses(self):
+        has_openings = self.business_employee_count_arr < self.business_max_employees_arr
+        open_manufacturing = has_openings & IS_MANUFACTURING[self.business_type_arr]
+        self.open_businesses = [self.businesses[i] for i in np.flatnonzero(has_openings).tolist()]
+        self.open_manufacturing = [self.businesses[i] for i in np.flatnonzero(open_manufacturing).tolist()]
+    def close_openings(self, business):
+        self.open_businesses.remove(business)
+        if IS_MANUFACTURING[self.business_type_arr[business.idx]]:
+            self.open_manufacturing.remove(business)
+    def update_businesses(self):
+        employee_count = self.business_employee_count_arr
+        self.business_tax_total, self.business_import_duty_total = step_businesses(
+            self.business_type_arr, self.business_size_factor_arr, self.business_automation_level_arr,
+            self.business_interest_rate_sensitivity_arr, employee_count, self.business_payroll_arr,
+            self.business_max_employees_arr, self.business_revenue_arr, self.business_costs_arr,
+            self.business_profit_arr, self.business_tax_arr, self.business_import_duty_arr,
+            self.business_borrowing_arr, float(self.economic_growth), float(self.local_manufacturing_boost),
+            float(self.external_influences), float(self.import_duty_rate), float(self.development_level),
+            float(self.money_supply), float(self.interest_rate), float(self.inflation), float(self.tax_rate)
+        )
+        for idx in np.flatnonzero(employee_count > self.business_max_employees_arr):
+            self.businesses[idx].lay_off_excess_employees()
+        self.refresh_open_businesses()
+    def step(self):
+        # Countries do not interact within a step, so each one runs all of its phases in one pass
+        self.update_businesses()
+        self.update_employment()
+        self.update_citizens()
+        self.update_external_factors()
+    def update_employment(self):
+        # The manufacturing preference is the same for every citizen, so it is decided once per step
+        prefer_manufacturing = self.local_manufacturing_boost > 0.1
+        if not self.open_businesses:
+            return
+        # Only unemployed citizens search; employed_arr gives them without a call per citizen
+        job_seekers = np.flatnonzero(~self.employed_arr).tolist()
+        # One uniform draw per job seeker, taken in a single call, picks their potential employer,
+        # and the salary they would be hired at is drawn the same way from their expertise range
+        draws = self.rng.random(len(job_seekers)).tolist()
+        expertise_ids = self.expertise_arr[job_seekers]
+        salaries = self.rng.integers(EXPERTISE_SALARY_LOW[expertise_ids], EXPERTISE_SALARY_HIGH[expertise_ids],
+                                     endpoint=True).tolist()
+        for idx, draw, salary in zip(job_seekers, draws, salaries):
+            self.citizens[idx].seek_employment(prefer_manufacturing, draw, salary)
+            if not self.open_businesses:
+                break  # Every opening is filled; the remaining job seekers would find nothing
+    def update_citizens(self):
+        # Uniform(-10, 10) noise drawn straight into float32 to match the citizen arrays
+        noise = self.rng.random(len(self.citizens), dtype=np.float32)
+        noise *= 20
+        noise -= 10
+        self.happiness_total = step_happiness(
+            self.salary_arr, self.employed_arr, self.savings_arr, self.happiness_arr,
+            self.values_social_services_arr, self.values_economic_freedom_arr, self.trust_in_government_arr,
+            self.import_goods_preference_arr, self.import_price_sensitivity_arr,
+            self.inflation_sensitivity_arr, noise, float(self.tax_rate), float(self.social_services_spending),
+            float(self.import_duty_rate), float(self.local_manufacturing_boost), float(self.inflation),
+            float(self.interest_rate)
+        )
     def update_external_factors(self):
+        # Each state variable is read into a local once and written back once it is final
         self.external_influences = max(-100, min(100, 
             self.external_influences + self.random.randint(-10, 10)))
+        external_factor = self.external_influences * 0.01
+        import_duty_rate = self.import_duty_rate
         self.government_spending = (
             self.total_revenue * (1 - 0.1)  # Reserve 10% for other expenses
             + self.bonds_issued * 0.2  # Use some of the issued bonds
         )        
+        money_supply = self.money_supply
+        economic_growth = self.economic_growth
         money_supply_change = (
             (0.03 - self.interest_rate) * 100 +
-            self.government_spending / 1000 +
-            self.central_bank_policy * self.money_supply * 0.1 +
-            self.economic_growth * self.money_supply * 0.5
+            self.government_spending * 0.001 +
+            (self.central_bank_policy * 0.1 + economic_growth * 0.5) * money_supply
         )
-        self.money_supply = max(self.money_supply * 0.9, 
-                               min(self.money_supply * 1.1, 
-                                  self.money_supply + money_supply_change))
+        # Money supply moves by at most 10% per step
+        max_money_supply_change = money_supply * 0.1
+        money_supply += max(-max_money_supply_change, min(max_money_supply_change, money_supply_change))
+        self.money_supply = money_supply
         
-        policy_adjustment = (0.02 - self.inflation) * 0.1 + self.random.uniform(-0.03, 0.03)
-        self.central_bank_policy = max(-0.2, min(0.2, self.central_bank_policy + policy_adjustment))
+        inflation = self.inflation
+        policy_adjustment = (0.02 - inflation) * 0.1 + self.random.uniform(-0.03, 0.03)
+        central_bank_policy = max(-0.2, min(0.2, self.central_bank_policy + policy_adjustment))
+        self.central_bank_policy = central_bank_policy
         interest_rate_change = (
-            self.central_bank_policy * -0.1 +  # Negative correlation with central bank policy
-            (self.inflation - 0.02) * 0.2 +  # Positive correlation with inflation
+            central_bank_policy * -0.1 +  # Negative correlation with central bank policy
+            (inflation - 0.02) * 0.2 +  # Positive correlation with inflation
             self.random.uniform(-0.002, 0.002)  # Small random factor
         )
-        self.interest_rate = max(0.005, min(0.12, self.interest_rate + interest_rate_change))
+        interest_rate = max(0.005, min(0.12, self.interest_rate + interest_rate_change))
+        self.interest_rate = interest_rate
+        interest_rate_gap = interest_rate - 0.03
         theoretical_inflation = (
-            (self.money_supply * self.money_velocity) / 
-            (self.wealth_level * 1000 * (1 + self.economic_growth))
+            (money_supply * self.money_velocity) / 
+            (self.wealth_level * 1000 * (1 + economic_growth))
         ) - 1
-        inflation_change = (theoretical_inflation - self.inflation) * 0.2 + (
+        inflation_change = (theoretical_inflation - inflation) * 0.2 + (
             0.005 * (self.social_services_spending - 0.3) +  # Higher spending increases inflation
-            0.01 * (self.interest_rate - 0.03) +  # Higher rates decrease inflation (now reversed)
-            0.002 * (self.external_influences / 100) +  # External factors
-            0.003 * self.import_duty_rate  # Import duties can increase inflation
+            0.01 * interest_rate_gap +  # Higher rates decrease inflation (now reversed)
+            0.002 * external_factor +  # External factors
+            0.003 * import_duty_rate  # Import duties can increase inflation
         )
-        self.inflation = max(0, min(0.2, self.inflation + inflation_change))
-        self.local_manufacturing_boost = self.import_duty_rate * 2  # Simple linear relationship
+        inflation = max(0, min(0.2, inflation + inflation_change))
+        self.inflation = inflation
+        local_manufacturing_boost = import_duty_rate * 2  # Simple linear relationship
+        self.local_manufacturing_boost = local_manufacturing_boost
         growth_change = (
-            0.005 * (0.03 - self.interest_rate) +  # Lower rates increase growth
-            0.002 * (self.external_influences / 100) +  # External factors
+            -0.005 * interest_rate_gap +  # Lower rates increase growth
+            0.002 * external_factor +  # External factors
             0.003 * (0.3 - self.tax_rate) +  # Lower taxes increase growth
-            0.004 * self.local_manufacturing_boost -  # Local manufacturing boost helps growth
-            0.006 * self.import_duty_rate +  # But high import duties can hurt overall growth
-            0.003 * (self.money_supply / 1000 - 1) -  # Moderate money supply growth helps
-            0.01 * max(0, self.inflation - 0.03)  # High inflation hurts growth
+            0.004 * local_manufacturing_boost -  # Local manufacturing boost helps growth
+            0.006 * import_duty_rate +  # But high import duties can hurt overall growth
+            0.003 * (money_supply * 0.001 - 1) -  # Moderate money supply growth helps
+            0.01 * max(0, inflation - 0.03)  # High inflation hurts growth
         )
-        self.economic_growth = max(-0.05, min(0.1, self.economic_growth + growth_change))
-        self.tax_revenue = 0
-        self.import_duty_revenue = 0
-        for citizen in self.citizens:
-            if citizen.employed:
-                self.tax_revenue += citizen.salary * self.tax_rate
-        
-        for business in self.businesses:
-            self.tax_revenue += business.tax_payable
-            if business.business_type.startswith("import"):
-                self.import_duty_revenue += business.revenue * self.import_duty_rate
+        economic_growth = max(-0.05, min(0.1, economic_growth + growth_change))
+        self.economic_growth = economic_growth
+        # The business totals and happiness_total were returned by this step's kernels
+        self.tax_revenue = self.employed_salary_sum * self.tax_rate + self.business_tax_total
+        # Import duty payable is revenue * import_duty_rate for import businesses and zero for the rest
+        self.import_duty_revenue = self.business_import_duty_total
         self.total_revenue = self.tax_revenue + self.import_duty_revenue
-        self.bond_interest_rate = self.interest_rate + max(0.01, self.inflation * 0.5)
+        self.bond_interest_rate = interest_rate + max(0.01, inflation * 0.5)
         self.interest_payments = self.bonds_issued * self.bond_interest_rate
         if self.citizens:
-            self.citizen_happiness = sum(c.happiness for c in self.citizens) / len(self.citizens)
+            self.citizen_happiness = self.happiness_total / len(self.citizens)
         else:
             self.citizen_happiness = 50  # Default value
         velocity_change = (
-            self.economic_growth * 0.5 +  # Higher growth increases velocity
-            (self.interest_rate - 0.03) * 0.2 +  # Higher interest rates increase velocity
+            economic_growth * 0.5 +  # Higher growth increases velocity
+            interest_rate_gap * 0.2 +  # Higher interest rates increase velocity
             self.random.uniform(-0.05, 0.05)  # Random factor
         )
         self.money_velocity = max(1.2, min(3.0, self.money_velocity + velocity_change))
     def collect_statistics(self):
-        print(f"Country statistics:")
-        print(f"  Tax rate: {self.tax_rate:.2f}")
-        print(f"  Import duty rate: {self.import_duty_rate:.2f}")
-        print(f"  Interest rate: {self.interest_rate:.2f}")
-        print(f"  Inflation: {self.inflation:.2f}")
-        print(f"  Economic growth: {self.economic_growth:.2f}")
-        print(f"  Tax revenue: {self.tax_revenue:.2f}")
-        print(f"  Import duty revenue: {self.import_duty_revenue:.2f}")
-        print(f"  Total government revenue: {self.total_revenue:.2f}")
-        print(f"  Local manufacturing boost: {self.local_manufacturing_boost:.2f}")
-        print(f"  Money supply: {self.money_supply:.2f}")
-        print(f"  Money velocity: {self.money_velocity:.2f}")
-        print(f"  Government spending: {self.government_spending:.2f}")
-        print(f"  Central bank policy: {self.central_bank_policy:.2f}")
-        print(f"  Citizen happiness: {self.citizen_happiness:.2f}")
-        print(f"  Number of citizens: {len(self.citizens)}")
-        print(f"  Number of businesses: {len(self.businesses)}")
-
-class Citizen(mesa.Agent):
-    def __init__(self, model, country=None, citizen_params=None):
-        super().__init__(model)
+        print(COUNTRY_STATISTICS_TEMPLATE.format(
+            self=self, num_citizens=len(self.citizens), num_businesses=len(self.businesses)))
+
+# Citizens and businesses are plain objects rather than mesa.Agent: they are only ever reached
+# through country.citizens / country.businesses, so registering each one in Mesa's agent sets
+# would only add construction cost
+class Citizen:
+    salary = CountryArrayField("salary_arr")
+    employed = CountryArrayField("employed_arr")
+    happiness = CountryArrayField("happiness_arr")
+    savings = CountryArrayField("savings_arr")
+    values_social_services = CountryArrayField("values_social_services_arr")
+    values_economic_freedom = CountryArrayField("values_economic_freedom_arr")
+    trust_in_government = CountryArrayField("trust_in_government_arr")
+    import_goods_preference = CountryArrayField("import_goods_preference_arr")
+    import_price_sensitivity = CountryArrayField("import_price_sensitivity_arr")
+    inflation_sensitivity = CountryArrayField("inflation_sensitivity_arr")
+    expertise_id = CountryArrayField("expertise_arr")
+    __slots__ = ("model", "random", "country", "idx", "employment_matches_expertise", "agent_type")
+    def __init__(self, model, country):
+        # Expertise and numeric state are drawn in bulk by Country.add_citizens
+        self.model = model
+        self.random = model.random
         self.country = country
-        development_level_category = "medium"
-        params = None
-        if country and citizen_params:
-            dev_level = country.development_level
-            if dev_level > 0.7:
-                development_level_category = "high"
-            elif dev_level > 0.4:
-                development_level_category = "medium"
-            else:
-                development_level_category = "low"                
-            if development_level_category in citizen_params:
-                params = citizen_params[development_level_category]
-        if params:
-            self.salary = self.random.randint(
-                int(params["min_salary"]), 
-                int(params["max_salary"])
-            )
-            expertise_distribution = [
-                params["expertise_low_pct"],
-                params["expertise_medium_pct"],
-                params["expertise_high_pct"],
-                params["expertise_expert_pct"]
-            ]
-            expertise_levels = ["low", "medium", "high", "expert"]
-            total = sum(expertise_distribution)
-            expertise_distribution = [p/total for p in expertise_distribution]
-            self.expertise = self.random.choices(
-                expertise_levels, 
-                weights=expertise_distribution, 
-                k=1
-            )[0]
-            self.values_social_services = self.random.uniform(
-                params["min_values_social_services"],
-                params["max_values_social_services"]
-            )
-            self.values_economic_freedom = self.random.uniform(
-                params["min_values_economic_freedom"],
-                params["max_values_economic_freedom"]
-            )
-            self.trust_in_government = self.random.uniform(
-                params["min_trust_in_government"], 
-                params["max_trust_in_government"]
-            )
-            self.import_goods_preference = self.random.uniform(
-                params["min_import_goods_preference"],
-                params["max_import_goods_preference"]
-            )
-            self.import_price_sensitivity = self.random.uniform(
-                params["min_import_price_sensitivity"],
-                params["max_import_price_sensitivity"]
-            )
-            self.inflation_sensitivity = self.random.uniform(
-                params["min_inflation_sensitivity"],
-                params["max_inflation_sensitivity"]
-            )
-            self.savings = self.random.uniform(
-                params["min_savings"],
-                params["max_savings"]
-            )
-            self.employed = self.random.random() < params["initial_employment_rate"]
-        else:
-            # Use default values as in original code
-            self.salary = self.random.randint(40, 60)
-            self.expertise = self.random.choice(["low", "medium", "high", "expert"])
-            self.values_social_services = self.random.uniform(0, 1)
-            self.values_economic_freedom = self.random.uniform(0, 1)
-            self.trust_in_government = self.random.uniform(0, 1)
-            self.import_goods_preference = self.random.uniform(0.2, 0.8)
-            self.import_price_sensitivity = self.random.uniform(0.3, 1.0)
-            self.inflation_sensitivity = self.random.uniform(0.3, 1.0)
-            self.savings = self.random.uniform(10, 100)
-            self.employed = self.random.random() < 0.8
-        self.happiness = self.random.randint(40, 60)
-        self.employer = None
+        self.idx = len(country.citizens)
+        country.citizens.append(self)
         self.employment_matches_expertise = False
         self.agent_type = "Citizen"
-    def seek_employment(self):
-        if self.country is None or self.employed:
+    @property
+    def expertise(self):
+        return EXPERTISE_LEVELS[self.expertise_id]
+    @property
+    def employer(self):
+        business_idx = self.country.employer_arr[self.idx]
+        return self.country.businesses[business_idx] if business_idx >= 0 else None
+    @employer.setter
+    def employer(self, business):
+        self.country.employer_arr[self.idx] = -1 if business is None else business.idx
+    def seek_employment(self, prefer_manufacturing=None, draw=None, salary=None):
+        if self.employed:
             return
-        available_businesses = [b for b in self.country.businesses if b.has_openings()]
+        country = self.country
+        available_businesses = country.open_businesses
         if available_businesses:
-            if self.country.local_manufacturing_boost > 0.1:
-                local_manufacturing = [b for b in available_businesses if b.business_type.startswith("manufacturing")]
-                if local_manufacturing:
-                    available_businesses = local_manufacturing
-            potential_employer = self.random.choice(available_businesses)
-            hired = potential_employer.hire_employee(self)
+            if prefer_manufacturing is None:
+                prefer_manufacturing = country.local_manufacturing_boost > 0.1
+            if prefer_manufacturing and country.open_manufacturing:
+                available_businesses = country.open_manufacturing
+            if draw is None:
+                potential_employer = self.random.choice(available_businesses)
+            else:
+                potential_employer = available_businesses[int(draw * len(available_businesses))]
+            hired = potential_employer.hire_employee(self, salary)
             if hired:
                 self.employed = True
                 self.employer = potential_employer
-                if self.expertise == "expert" and potential_employer.expert_employees > 0:
-                    self.employment_matches_expertise = True
-                elif self.expertise == "high" and potential_employer.white_collar_employees > 0:
-                    self.employment_matches_expertise = True
-                elif self.expertise in ["medium", "low"] and potential_employer.blue_collar_employees > 0:
+                if potential_employer.collar_counts[EXPERTISE_COLLAR[self.expertise_id]] > 0:
                     self.employment_matches_expertise = True
-    def update_happiness(self):
-        if self.country is None:
-            return            
-        economic_factor = 0
-        if self.employed:
-            economic_factor = min(100, self.salary * (1 - self.country.tax_rate))
-        else:
-            economic_factor = min(50, self.country.social_services_spending * 100)        
-        social_services_satisfaction = (
-            self.values_social_services * self.country.social_services_spending * 100
-        )
-        economic_freedom_satisfaction = (
-            self.values_economic_freedom * (1 - self.country.tax_rate) * 100
-        )
-        trust_factor = self.trust_in_government * 20        
-        import_price_impact = -self.import_goods_preference * self.import_price_sensitivity * self.country.import_duty_rate * 100
-        employment_opportunity_impact = 0
-        if not self.employed:
-            employment_opportunity_impact = self.country.local_manufacturing_boost * 20
-        else:
-            employment_opportunity_impact = self.country.local_manufacturing_boost * 5
-        inflation_impact = -self.inflation_sensitivity * self.country.inflation * 200
-        interest_impact = self.country.interest_rate * self.savings * 0.2
-        new_happiness = (
-            0.30 * economic_factor +
-            0.15 * social_services_satisfaction +
-            0.15 * economic_freedom_satisfaction +
-            0.08 * trust_factor +
-            0.08 * import_price_impact +
-            0.08 * employment_opportunity_impact +
-            0.08 * inflation_impact +  # NEW
-            0.05 * interest_impact +   # NEW
-            0.03 * self.random.uniform(-10, 10)  # Random factor
-        )
-        self.happiness = 0.7 * self.happiness + 0.3 * new_happiness
-        self.happiness = max(0, min(100, self.happiness))
-        if self.employed:
-            savings_change = (
-                self.salary * 0.1 +  # Save 10% of salary
-                self.savings * self.country.interest_rate -  # Interest earned
-                self.savings * self.country.inflation      # Eroded by inflation
-            )
-            self.savings = max(0, self.savings + savings_change)
-        else:
-            # Unemployed citizens spend savings
-            self.savings = max(0, self.savings * (1 - self.country.inflation - 0.05))
 
-class Business(mesa.Agent):
-    def __init__(self, model, country=None, business_params=None):
-        super().__init__(model)
+class Business:
+    size_factor = CountryArrayField("business_size_factor_arr")
+    automation_level = CountryArrayField("business_automation_level_arr")
+    interest_rate_sensitivity = CountryArrayField("business_interest_rate_sensitivity_arr")
+    investment_rate = CountryArrayField("business_investment_rate_arr")
+    max_employees = CountryArrayField("business_max_employees_arr")
+    employee_count = CountryArrayField("business_employee_count_arr")  # len(employees), kept in the array
+    payroll = CountryArrayField("business_payroll_arr")  # Running total of employee salaries
+    revenue = CountryArrayField("business_revenue_arr")
+    costs = CountryArrayField("business_costs_arr")
+    profit = CountryArrayField("business_profit_arr")
+    tax_payable = CountryArrayField("business_tax_arr")
+    import_duty_payable = CountryArrayField("business_import_duty_arr")
+    borrowing = CountryArrayField("business_borrowing_arr")
+    __slots__ = ("model", "random", "country", "idx", "collar_counts", "employees", "agent_type")
+    def __init__(self, model, country):
+        # Type and numeric state are drawn in bulk by Country.add_businesses
+        self.model = model
+        self.random = model.random
         self.country = country
-        development_level_category = "medium"
-        params = None
-        if country and business_params:
-            dev_level = country.development_level
-            if dev_level > 0.7:
-                development_level_category = "high"
-            elif dev_level > 0.4:
-                development_level_category = "medium"
-            else:
-                development_level_category = "low"
-                
-            if development_level_category in business_params:
-                params = business_params[development_level_category]
-        if params:
-            business_types = [
-                "manufacturing_local_consumers",
-                "manufacturing_local_businesses",
-                "manufacturing_export",
-                "import_citizens_consumers",
-                "import_business_customers",
-                "ai"
-            ]
-            business_weights = [
-                params["manufacturing_local_consumers_pct"],
-                params["manufacturing_local_businesses_pct"],
-                params["manufacturing_export_pct"],
-                params["import_citizens_consumers_pct"],
-                params["import_business_customers_pct"],
-                params["ai_pct"]
-            ]
-            total = sum(business_weights)
-            business_weights = [w/total for w in business_weights]
-            self.business_type = self.random.choices(
-                business_types, 
-                weights=business_weights, 
-                k=1
-            )[0]
-            self.automation_level = self.random.uniform(
-                params["min_automation_level"],
-                params["max_automation_level"]
-            )
-            self.size_factor = self.random.uniform(
-                params["min_size_factor"],
-                params["max_size_factor"]
-            )
-            self.investment_rate = self.random.uniform(
-                params["min_investment_rate"],
-                params["max_investment_rate"]
-            )
-            self.interest_rate_sensitivity = self.random.uniform(
-                params["min_interest_rate_sensitivity"],
-                params["max_interest_rate_sensitivity"]
-            )
-        else:
-            self.business_type = self.random.choice([
-                "manufacturing_local_consumers",
-                "manufacturing_local_businesses",
-                "manufacturing_export",
-                "import_citizens_consumers",
-                "import_business_customers",
-                "ai"
-            ])
-            self.automation_level = self.random.uniform(0.1, 0.9)
-            self.size_factor = self.random.uniform(0.5, 2.0)
-            self.investment_rate = self.random.uniform(0.1, 0.4)
-            self.interest_rate_sensitivity = self.random.uniform(0.5, 1.5)
-        self.blue_collar_employees = 0
-        self.white_collar_employees = 0
-        self.expert_employees = 0
-        self.revenue = 0
-        self.costs = 0
-        self.profit = 0
-        self.tax_payable = 0
-        self.import_duty_payable = 0
-        self.borrowing = 0
+        self.idx = len(country.businesses)
+        country.businesses.append(self)
+        # Employees per collar bucket: blue collar, white collar, expert (see EXPERTISE_COLLAR)
+        self.collar_counts = [0, 0, 0]
         self.employees = []
-        self.max_employees = int(10 * self.size_factor)
-        if self.business_type == "ai":
-            self.max_employees = int(2 * self.size_factor)  # AI businesses need fewer employees
         self.agent_type = "Business"
-    def update_business(self):
-        if self.country is None:
-            return
-        base_revenue_factor = 1.0
-        if self.business_type.startswith("manufacturing"):
-            base_revenue_factor += self.country.economic_growth * 2
-            # Local manufacturing gets a boost from import duties
-            base_revenue_factor += self.country.local_manufacturing_boost            
-            if self.business_type == "manufacturing_export":
-                base_revenue_factor += self.country.external_influences / 200  # External influences affect exports        
-        elif self.business_type.startswith("import"):
-            base_revenue_factor += self.country.economic_growth
-            base_revenue_factor -= self.country.import_duty_rate * 2
-            base_revenue_factor -= self.country.external_influences / 300  # External influences can affect imports        
-        elif self.business_type == "ai":
-            base_revenue_factor += self.country.economic_growth * 3  # AI businesses benefit more from growth
-            base_revenue_factor += self.country.development_level * 0.5  # More developed countries have better AI businesses
-        money_supply_effect = (self.country.money_supply / 1000) * 0.2
-        base_revenue_factor += money_supply_effect
-        interest_rate_effect = (0.05 - self.country.interest_rate) * self.interest_rate_sensitivity
-        base_revenue_factor += interest_rate_effect
-        employee_factor = len(self.employees) / max(1, self.max_employees)
-        self.revenue = 100 * self.size_factor * base_revenue_factor * (0.5 + 0.5 * employee_factor)
-        employee_costs = sum(employee.salary for employee in self.employees)
-        operating_costs = 20 * self.size_factor * (1 - 0.5 * self.automation_level)
-        interest_costs = self.borrowing * self.country.interest_rate
-        import_duty_costs = 0
-        if self.business_type.startswith("import"):
-            import_duty_costs = self.revenue * self.country.import_duty_rate
-            self.import_duty_payable = import_duty_costs
-        inflation_cost_increase = operating_costs * self.country.inflation * 2        
-        self.costs = employee_costs + operating_costs + import_duty_costs + interest_costs + inflation_cost_increase
-        self.profit = self.revenue - self.costs
-        if self.profit > 0:
-            self.tax_payable = self.profit * self.country.tax_rate
-        else:
-            self.tax_payable = 0
-        if self.country.interest_rate < 0.04 and self.profit > 0:
-            new_borrowing = self.revenue * 0.1 * (1 - self.country.interest_rate * 10)
-            self.borrowing += new_borrowing
-        else:
-            self.borrowing = max(0, self.borrowing * 0.95)
-        size_change_factor = 0
-        if self.profit > 50 * self.size_factor and len(self.employees) >= self.max_employees * 0.9:
-            size_change_factor = 0.1
-        elif self.profit < -20 * self.size_factor:
-            size_change_factor = -0.1
-        interest_expansion_factor = (0.05 - self.country.interest_rate) * self.interest_rate_sensitivity * 0.5
-        size_change_factor += interest_expansion_factor
-        if size_change_factor > 0:
-            self.max_employees = min(100, int(self.max_employees * (1 + size_change_factor)))
-        elif size_change_factor < 0:
-            self.max_employees = max(1, int(self.max_employees * (1 + size_change_factor)))
-            while len(self.employees) > self.max_employees:
-                employee = self.random.choice(self.employees)
-                employee.employed = False
-                employee.employer = None
-                self.employees.remove(employee)    
+    @property
+    def business_type(self):
+        return BusinessType(self.country.business_type_arr[self.idx])
+    @property
+    def blue_collar_employees(self):
+        return self.collar_counts[0]
+    @property
+    def white_collar_employees(self):
+        return self.collar_counts[1]
+    @property
+    def expert_employees(self):
+        return self.collar_counts[2]
+    def lay_off_excess_employees(self):
+        country = self.country
+        n = len(self.employees)
+        max_employees = self.max_employees
+        laid_off = []
+        while n > max_employees:
+            # Swap the chosen employee with the last one and pop
+            i = self.random.randrange(n)
+            employee = self.employees[i]
+            self.employees[i] = self.employees[-1]
+            self.employees.pop()
+            n -= 1
+            laid_off.append(employee.idx)
+            self.collar_counts[EXPERTISE_COLLAR[employee.expertise_id]] -= 1
+        # Release everyone laid off with one write per citizen array
+        laid_off_salaries = float(country.salary_arr[laid_off].sum(dtype=np.float64))
+        country.employed_arr[laid_off] = False
+        country.employer_arr[laid_off] = -1
+        self.payroll -= laid_off_salaries
+        country.employed_salary_sum -= laid_off_salaries
+        self.employee_count = n
     def has_openings(self):
-        return len(self.employees) < self.max_employees
+        return self.employee_count < self.max_employees
     
-    def hire_employee(self, citizen):
+    def hire_employee(self, citizen, salary=None):
         if not self.has_openings():
             return False
         self.employees.append(citizen)
-        if citizen.expertise == "expert":
-            self.expert_employees += 1
-            citizen.salary = self.random.randint(80, 100)
-        elif citizen.expertise == "high":
-            self.white_collar_employees += 1
-            citizen.salary = self.random.randint(60, 80)
-        else:  # "medium" or "low"
-            self.blue_collar_employees += 1
-            citizen.salary = self.random.randint(40, 60)            
+        self.employee_count += 1
+        if not self.has_openings():
+            self.country.close_openings(self)
+        expertise_id = citizen.expertise_id
+        self.collar_counts[EXPERTISE_COLLAR[expertise_id]] += 1
+        if salary is None:
+            salary = self.random.randint(*EXPERTISE_SALARY_RANGE[expertise_id])
+        citizen.salary = salary
+        self.payroll += salary
+        self.country.employed_salary_sum += salary
         return True
 
 class EconomicModel(mesa.Model):
     def __init__(self, config_manager=None, num_countries=1, citizens_per_country=100, 
-                 businesses_per_country=10, policy_params=None):
-        super().__init__()
+                 businesses_per_country=10, policy_params=None, seed=None, num_steps=None):
+        super().__init__(seed=seed)
         self.config_manager = config_manager
         country_configs = None
         citizen_params = None
@@ -649,19 +909,6 @@ class EconomicModel(mesa.Model):
         self.citizens_per_country = citizens_per_country
         self.businesses_per_country = businesses_per_country
         self.countries = []
-        self.data = {
-            'inflation': [[] for _ in range(self.num_countries)],
-            'economic_growth': [[] for _ in range(self.num_countries)],
-            'tax_revenue': [[] for _ in range(self.num_countries)],
-            'import_duty_revenue': [[] for _ in range(self.num_countries)],
-            'total_revenue': [[] for _ in range(self.num_countries)],
-            'citizen_happiness': [[] for _ in range(self.num_countries)],
-            'local_manufacturing_boost': [[] for _ in range(self.num_countries)],
-            'money_supply': [[] for _ in range(self.num_countries)],
-            'interest_rate': [[] for _ in range(self.num_countries)],
-            'central_bank_policy': [[] for _ in range(self.num_countries)],
-            'government_spending': [[] for _ in range(self.num_countries)]  # NEW
-        }
         
         # Use rich country configuration (development_level > 0.7)
         country_config = {
@@ -681,116 +928,180 @@ class EconomicModel(mesa.Model):
         self.countries.append(country)
         
         for country in self.countries:
-            dev_level_category = self.config_manager.get_development_level_category(country.development_level) if self.config_manager else None
-            for _ in range(self.citizens_per_country):
-                citizen = Citizen(self, country, citizen_params)
-                country.citizens.append(citizen)
-            for _ in range(self.businesses_per_country):
-                business = Business(self, country, business_params)
-                country.businesses.append(business)
+            country.add_citizens(self.citizens_per_country, citizen_params)
+            country.add_businesses(self.businesses_per_country, business_params)
+        # History as one (metric, country, step) array in HISTORY_KEYS order, doubled in capacity
+        # when full; pass num_steps when the run length is known to allocate it once
+        self._t = 0
+        self._history = np.empty((len(HISTORY_KEYS), len(self.countries), num_steps or 32))
+        # plot_results keeps its figure and lines so later calls only update the line data
+        self._figure = None
+        self._plot_lines = None
         
-        print(f"Created {len(self.countries)} countries with {self.citizens_per_country} citizens and {self.businesses_per_country} businesses each")
+        logger.debug("Created %d countries with %d citizens and %d businesses each",
+                     len(self.countries), self.citizens_per_country, self.businesses_per_country)
 
     def step(self):
         for country in self.countries:
-            for business in country.businesses:
-                business.update_business()
-        for country in self.countries:
-            for citizen in country.citizens:
-                citizen.seek_employment()
-                citizen.update_happiness()
+            country.step()
+        if self._t == self._history.shape[2]:
+            self._history = np.concatenate([self._history, np.empty_like(self._history)], axis=2)
         for i, country in enumerate(self.countries):
-            country.update_external_factors()
-            self.data['inflation'][i].append(country.inflation)
-            self.data['economic_growth'][i].append(country.economic_growth)
-            self.data['tax_revenue'][i].append(country.tax_revenue)
-            self.data['import_duty_revenue'][i].append(country.import_duty_revenue)
-            self.data['total_revenue'][i].append(country.total_revenue)
-            self.data['citizen_happiness'][i].append(country.citizen_happiness)
-            self.data['local_manufacturing_boost'][i].append(country.local_manufacturing_boost)
-            self.data['money_supply'][i].append(country.money_supply)
-            self.data['interest_rate'][i].append(country.interest_rate)
-            self.data['central_bank_policy'][i].append(country.central_bank_policy)
-            self.data['government_spending'][i].append(country.government_spending)  # NEW
+            self._history[:, i, self._t] = HISTORY_GETTER(country)
+        self._t += 1
+
+    def run(self, steps):
+        """Advance the model by `steps` steps, sizing the history for all of them up front."""
+        needed = self._t + steps - self._history.shape[2]
+        if needed > 0:
+            self._history = np.concatenate(
+                [self._history, np.empty(self._history.shape[:2] + (needed,))], axis=2)
+        step = self.step
+        for _ in range(steps):
+            step()
+
+    def tail_means(self, keys, last=5):
+        """Mean of each history key over every country's last `last` recorded steps, in one reduction."""
+        rows = [HISTORY_KEYS.index(key) for key in keys]
+        return self._history[rows, :, max(0, self._t - last):self._t].mean(axis=(1, 2)).tolist()
+
+    @property
+    def data(self):
+        # Recorded steps only, as (num_countries, steps) views into the history buffers
+        return {key: self._history[k, :, :self._t] for k, key in enumerate(HISTORY_KEYS)}
 
     def collect_statistics(self):
         for i, country in enumerate(self.countries):
             print(f"\nCountry {i+1}:")
             country.collect_statistics()
 
-def run_multiple_simulations(num_runs=10, num_countries=2, duty_rates=None, steps=20):
-    all_results = []    
+    def plot_results(self, output_file=None):
+        """Generate plots for key metrics; save them to output_file and close the figure when given."""
+        data = self.data
+        steps = np.arange(1, self._t + 1)
+        if self._figure is not None and plt.fignum_exists(self._figure.number):
+            # The figure from an earlier call is still open: move its lines to the current history
+            for ax, lines, (key, _, _) in zip(self._figure.axes, self._plot_lines, PLOT_PANELS):
+                for line, series in zip(lines, data[key]):
+                    line.set_data(steps, series)
+                ax.relim()
+                ax.autoscale_view()
+            self._figure.canvas.draw_idle()
+            self._show_figure(output_file)
+            return
+        labels = [f'Country {i+1} (Duty: {country.import_duty_rate:.2f})' for i, country in enumerate(self.countries)]
+        fig, axs = plt.subplots(3, 3, figsize=(18, 15))
+        fig.suptitle('Economic Model Simulation Results', fontsize=16)
+        self._figure = fig
+        self._plot_lines = []
+        for ax, (key, title, ylabel) in zip(axs.flat, PLOT_PANELS):
+            # One call draws a line per country from the columns of the transposed history
+            lines = ax.plot(steps, data[key].T)
+            self._plot_lines.append(lines)
+            ax.set_title(title)
+            ax.set_xlabel('Step')
+            ax.set_ylabel(ylabel)
+            ax.legend(lines, labels)
+            ax.grid(True)
+        plt.tight_layout(rect=[0, 0, 1, 0.95])
+        self._show_figure(output_file)
+
+    def _show_figure(self, output_file):
+        if output_file is None:
+            plt.show()
+        else:
+            # Rendered straight to file, so no GUI window is needed; closing frees the figure
+            self._figure.savefig(output_file, dpi=100, bbox_inches='tight')
+            plt.close(self._figure)
+
+def _map_tasks(func, tasks, desc, processes=None):
+    """
+    Apply func to every task and return the results in task order, with a progress bar.
+    The tasks run in this process unless more than one worker process is asked for: workers are
+    spawned and re-import this module first, which only pays off for long sweeps.
+    """
+    # The bar is switched off when stderr is not a terminal
+    if processes is None or processes <= 1:
+        return [func(task) for task in tqdm(tasks, desc=desc, disable=None)]
+    # Hand out several tasks per round trip to a worker, as Pool.map does
+    chunksize = max(1, len(tasks) // (processes * 4))
+    with Pool(processes) as pool:
+        return list(tqdm(pool.imap(func, tasks, chunksize), total=len(tasks), desc=desc, disable=None))
+
+def _run_replica(task):
+    """Run one model in a worker process and return its recorded data."""
+    seed, steps, model_kwargs = task
+    model = EconomicModel(seed=seed, num_steps=steps, **model_kwargs)
+    model.run(steps)
+    return model.data
+
+def run_batch(num_runs=10, steps=20, seed=None, processes=None, **model_kwargs):
+    """
+    Run independent replicas of the model, one replica per task, on `processes` worker processes
+    (in this process when None or 1).
+    Each replica gets its own seed spawned from `seed`, so a seeded batch is reproducible.
+    Returns a list with the data dict of every replica.
+    """
+    # Mesa seeds random.Random as well as NumPy, so each spawned child is reduced to a plain int
+    seeds = [int(child.generate_state(1)[0]) for child in np.random.SeedSequence(seed).spawn(num_runs)]
+    tasks = [(s, steps, model_kwargs) for s in seeds]
+    return _map_tasks(_run_replica, tasks, "Running replicas", processes)
+
+def _run_duty_rate_simulation(task):
+    """Run one simulation at a given import duty rate and average its last 5 steps."""
+    duty_rate, num_countries, steps = task
+    model = EconomicModel(
+        num_countries=num_countries, 
+        citizens_per_country=100, 
+        businesses_per_country=10,
+        policy_params={'import_duty_rate': duty_rate},
+        num_steps=steps
+    )
+    model.run(steps)
+    return model.tail_means([key for _, key in DUTY_RATE_COLUMNS])
+
+def _mean_by_rate(rate_name, rates, all_results, columns):
+    """
+    Average the per-run results over runs with the same rate, like a groupby on the rate column.
+    Returns one row per distinct rate, sorted by rate.
+    """
+    unique_rates, inverse = np.unique(np.asarray(rates, dtype=float), return_inverse=True)
+    results = np.array(all_results, dtype=float).reshape(len(inverse), len(columns))
+    sums = np.zeros((len(unique_rates), len(columns)))
+    np.add.at(sums, inverse, results)
+    grouped = pd.DataFrame(sums / np.bincount(inverse)[:, None], columns=[column for column, _ in columns])
+    grouped.insert(0, rate_name, unique_rates)
+    return grouped
+
+def run_multiple_simulations(num_runs=10, num_countries=2, duty_rates=None, steps=20, processes=None):
     if duty_rates is None:
         duty_rates = np.linspace(0.0, 0.5, 6)  # 0%, 10%, 20%, 30%, 40%, 50%
-    pbar = tqdm(total=num_runs * len(duty_rates), desc="Running simulations")
-    for duty_rate in duty_rates:
-        duty_results = []
-        for _ in range(num_runs):
-            model = EconomicModel(
-                num_countries=num_countries, 
-                citizens_per_country=100, 
-                businesses_per_country=10,
-                import_duty_rates=[duty_rate] * num_countries
-            )
-            for _ in range(steps):
-                model.step()
-            avg_happiness = np.mean([np.mean(model.data['citizen_happiness'][i][-5:]) for i in range(num_countries)])
-            avg_growth = np.mean([np.mean(model.data['economic_growth'][i][-5:]) for i in range(num_countries)])
-            avg_revenue = np.mean([np.mean(model.data['total_revenue'][i][-5:]) for i in range(num_countries)])
-            avg_inflation = np.mean([np.mean(model.data['inflation'][i][-5:]) for i in range(num_countries)])
-            avg_money_supply = np.mean([np.mean(model.data['money_supply'][i][-5:]) for i in range(num_countries)])
-            avg_interest_rate = np.mean([np.mean(model.data['interest_rate'][i][-5:]) for i in range(num_countries)])            
-            duty_results.append({
-                'duty_rate': duty_rate,
-                'avg_happiness': avg_happiness,
-                'avg_growth': avg_growth,
-                'avg_revenue': avg_revenue,
-                'avg_inflation': avg_inflation,
-                'avg_money_supply': avg_money_supply,
-                'avg_interest_rate': avg_interest_rate
-            })
-            pbar.update(1)        
-        all_results.extend(duty_results)    
-    pbar.close()
-    df = pd.DataFrame(all_results)
-    grouped = df.groupby('duty_rate').mean().reset_index()
-    return grouped
+    tasks = [(duty_rate, num_countries, steps) for duty_rate in duty_rates for _ in range(num_runs)]
+    all_results = _map_tasks(_run_duty_rate_simulation, tasks, "Running simulations", processes)
+    return _mean_by_rate('duty_rate', [task[0] for task in tasks], all_results, DUTY_RATE_COLUMNS)
+
+def _run_interest_rate_simulation(task):
+    """Run one single-country simulation from a given interest rate and average its last 5 steps."""
+    interest_rate, base_duty_rate = task
+    model = EconomicModel(
+        num_countries=1,  # For simplicity
+        citizens_per_country=100, 
+        businesses_per_country=10,
+        policy_params={'import_duty_rate': base_duty_rate},
+        num_steps=20
+    )
+    model.countries[0].interest_rate = interest_rate
+    model.run(20)
+    return model.tail_means([key for _, key in INTEREST_RATE_COLUMNS])
 
-def run_monetary_policy_analysis(base_duty_rate=0.2, interest_rates=None, num_runs=5):
-    all_results = []    
+def run_monetary_policy_analysis(base_duty_rate=0.2, interest_rates=None, num_runs=5, processes=None):
     if interest_rates is None:
         # Default set of interest rates to test
         interest_rates = np.linspace(0.01, 0.10, 5)  # 1% to 10%
-    pbar = tqdm(total=num_runs * len(interest_rates), desc="Running monetary policy simulations")
-    for interest_rate in interest_rates:
-        rate_results = []
-        for _ in range(num_runs):
-            model = EconomicModel(
-                num_countries=1,  # For simplicity
-                citizens_per_country=100, 
-                businesses_per_country=10,
-                import_duty_rates=[base_duty_rate]
-            )
-            model.countries[0].interest_rate = interest_rate
-            for _ in range(20):
-                model.step()
-            avg_happiness = np.mean(model.data['citizen_happiness'][0][-5:])
-            avg_growth = np.mean(model.data['economic_growth'][0][-5:])
-            avg_inflation = np.mean(model.data['inflation'][0][-5:])
-            avg_money_supply = np.mean(model.data['money_supply'][0][-5:])            
-            rate_results.append({
-                'interest_rate': interest_rate,
-                'avg_happiness': avg_happiness,
-                'avg_growth': avg_growth,
-                'avg_inflation': avg_inflation,
-                'avg_money_supply': avg_money_supply
-            })            
-            pbar.update(1)        
-        all_results.extend(rate_results)    
-    pbar.close()
-    df = pd.DataFrame(all_results)
-    grouped = df.groupby('interest_rate').mean().reset_index()
-    return grouped
+    tasks = [(interest_rate, base_duty_rate) for interest_rate in interest_rates for _ in range(num_runs)]
+    all_results = _map_tasks(_run_interest_rate_simulation, tasks, "Running monetary policy simulations",
+                             processes)
+    return _mean_by_rate('interest_rate', [task[0] for task in tasks], all_results, INTEREST_RATE_COLUMNS)
 
 def run_sensitivity_analysis(base_duty_rate=0.2, variation=0.1, num_runs=5):
     """Run a sensitivity analysis by varying import duty rates."""
@@ -801,26 +1112,36 @@ def run_sensitivity_analysis(base_duty_rate=0.2, variation=0.1, num_runs=5):
     results = run_multiple_simulations(num_runs=num_runs, duty_rates=duty_rates)
     return results
 
-def balance_budget(model, policy_params, max_iterations=10, tolerance=0.1):
+def balance_budget(model=None, policy_params=None, max_iterations=10, tolerance=0.1, *,
+                   config_manager=None, citizens_per_country=100, businesses_per_country=10):
     """
     Adjust policy parameters to ensure government spending is within tolerance of revenue.
     Tolerance is a fraction (e.g., 0.1 for ±10%).
+    The model settings are given as config_manager, citizens_per_country and businesses_per_country,
+    so callers need not build a model; a `model` passed as before supplies all three instead.
     """
-    country = model.countries[0]
+    if model is not None:
+        config_manager = model.config_manager
+        citizens_per_country = model.citizens_per_country
+        businesses_per_country = model.businesses_per_country
     for iteration in range(max_iterations):
         # Run a short simulation to estimate revenue and spending
         model = EconomicModel(
-            config_manager=model.config_manager,
+            config_manager=config_manager,
             num_countries=1,
-            citizens_per_country=model.citizens_per_country,
-            businesses_per_country=model.businesses_per_country,
-            policy_params=policy_params
+            citizens_per_country=citizens_per_country,
+            businesses_per_country=businesses_per_country,
+            policy_params=policy_params,
+            num_steps=5
         )
-        for _ in range(5):  # Short simulation to stabilize
-            model.step()
+        model.run(5)  # Short simulation to stabilize
+        
+        avg_revenue, avg_spending = model.tail_means(['total_revenue', 'government_spending'], last=3)
         
-        avg_revenue = np.mean(model.data['total_revenue'][0][-3:])
-        avg_spending = np.mean(model.data['government_spending'][0][-3:])
+        # With zero, negative or invalid revenue the ratio below is meaningless and no adjustment will
+        # converge, so stop here rather than run the remaining iterations
+        if not np.isfinite(avg_revenue) or avg_revenue <= 0:
+            return policy_params, avg_revenue, avg_spending
         
         # Check if budget is balanced within tolerance
         if abs(avg_spending - avg_revenue) / avg_revenue <= tolerance:
@@ -848,8 +1169,42 @@ def balance_budget(model, policy_params, max_iterations=10, tolerance=0.1):
     # If max iterations reached, return best effort
     return policy_params, avg_revenue, avg_spending
 
-def run_policy_combinations(num_runs=5, steps=20, output_file="policy_results.csv"):
+def _run_policy_combination(task):
+    """Balance the budget for one policy combination and run the full simulation with it."""
+    config_manager, policy_params, steps = task
+    balanced_params, avg_revenue, avg_spending = balance_budget(policy_params=policy_params.copy(),
+                                                                config_manager=config_manager)
+    
+    # Run full simulation with balanced parameters
+    model = EconomicModel(
+        config_manager=config_manager,
+        num_countries=1,
+        citizens_per_country=100,
+        businesses_per_country=10,
+        policy_params=balanced_params,
+        num_steps=steps
+    )
+    model.run(steps)
+    
+    # Collect results (average of last 5 steps for stability)
+    result = {
+        'tax_rate': balanced_params['tax_rate'],
+        'interest_rate': balanced_params['interest_rate'],
+        'social_services_spending': balanced_params['social_services_spending'],
+        'immigration_incentives': balanced_params['immigration_incentives'],
+        'import_duty_rate': balanced_params['import_duty_rate']
+    }
+    means = model.tail_means([key for _, key in POLICY_RESULT_COLUMNS])
+    result.update(zip([column for column, _ in POLICY_RESULT_COLUMNS], means))
+    return result
+
+def run_policy_combinations(num_runs=5, steps=20, output_file="policy_results.csv", processes=None):
     config_manager = ConfigManager(config_dir="my_config")
+    # Parse the parameter files (generating missing templates) once, before any task runs; the
+    # parsed tables travel with the config manager in every task, so workers never read the files
+    config_manager.load_country_parameters()
+    config_manager.load_citizen_parameters()
+    config_manager.load_business_parameters()
     
     # Define ranges for policy parameters
     tax_rates = np.linspace(0.2, 0.5, 4)  # 20% to 50%
@@ -858,11 +1213,7 @@ def run_policy_combinations(num_runs=5, steps=20, output_file="policy_results.cs
     immigration_incentives = np.linspace(0.0, 0.1, 3)  # 0% to 10%
     import_duty_rates = np.linspace(0.05, 0.3, 3)  # 5% to 30%
     
-    all_results = []
-    pbar = tqdm(total=num_runs * len(tax_rates) * len(interest_rates) * 
-                len(social_services_spendings) * len(immigration_incentives) * 
-                len(import_duty_rates), desc="Running policy simulations")
-    
+    tasks = []
     for tax_rate in tax_rates:
         for interest_rate in interest_rates:
             for social_spending in social_services_spendings:
@@ -875,43 +1226,9 @@ def run_policy_combinations(num_runs=5, steps=20, output_file="policy_results.cs
                             'immigration_incentives': immigration_incentive,
                             'import_duty_rate': import_duty_rate
                         }
-                        
-                        for _ in range(num_runs):
-                            # Balance the budget for this policy combination
-                            balanced_params, avg_revenue, avg_spending = balance_budget(
-                                EconomicModel(config_manager=config_manager),
-                                policy_params.copy()
-                            )
-                            
-                            # Run full simulation with balanced parameters
-                            model = EconomicModel(
-                                config_manager=config_manager,
-                                num_countries=1,
-                                citizens_per_country=100,
-                                businesses_per_country=10,
-                                policy_params=balanced_params
-                            )
-                            for _ in range(steps):
-                                model.step()
-                            
-                            # Collect results (average of last 5 steps for stability)
-                            result = {
-                                'tax_rate': balanced_params['tax_rate'],
-                                'interest_rate': balanced_params['interest_rate'],
-                                'social_services_spending': balanced_params['social_services_spending'],
-                                'immigration_incentives': balanced_params['immigration_incentives'],
-                                'import_duty_rate': balanced_params['import_duty_rate'],
-                                'avg_happiness': np.mean(model.data['citizen_happiness'][0][-5:]),
-                                'avg_growth': np.mean(model.data['economic_growth'][0][-5:]),
-                                'avg_revenue': np.mean(model.data['total_revenue'][0][-5:]),
-                                'avg_spending': np.mean(model.data['government_spending'][0][-5:]),
-                                'avg_inflation': np.mean(model.data['inflation'][0][-5:]),
-                                'avg_money_supply': np.mean(model.data['money_supply'][0][-5:])
-                            }
-                            all_results.append(result)
-                            pbar.update(1)
+                        tasks.extend((config_manager, policy_params, steps) for _ in range(num_runs))
     
-    pbar.close()
+    all_results = _map_tasks(_run_policy_combination, tasks, "Running policy simulations", processes)
     
     # Save results to CSV
     df = pd.DataFrame(all_results)
@@ -924,6 +1241,13 @@ def run_policy_combinations(num_runs=5, steps=20, output_file="policy_results.cs
     return grouped
 
 if __name__ == "__main__":
+    # Importing mesa sets the multiprocessing start method to "spawn" on every platform, so sweeps run
+    # with several processes start workers that re-import this module instead of forking it. Each task
+    # therefore carries everything it needs (config manager, rates, policy parameters), and this guard
+    # keeps the workers from rerunning the script. freeze_support() is needed before the first Pool
+    # when frozen into a Windows executable
+    freeze_support()
+    logging.basicConfig(level=logging.WARNING)
     config_manager = ConfigManager(config_dir="my_config")
     choice = input("Enter 1 if you wish to create template csv configuration files, 2 if not: ")
     if choice == "1":